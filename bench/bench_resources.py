@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+# Micro-benchmark of IO requests/lookups on the largest platforms, comparing the default litex
+# ConstraintManager with litex_boards.build.resources.IndexedConstraintManager.
+
+import argparse
+import importlib
+import timeit
+
+from litex.build.generic_platform import ConstraintManager
+
+from litex_boards.build.resources import IndexedConstraintManager
+
+# Helpers ------------------------------------------------------------------------------------------
+
+_probes = ["clk200", "sgmii_clock", "eth_clocks", "ddram_dual_rank", "missing"]
+
+def _lookups(cm, io):
+    # Probe every requested resource plus some optional/missing ones, like do_finalize does.
+    for resource in io:
+        cm.lookup_request(resource[0], resource[1])
+    for name in _probes:
+        cm.lookup_request(name, loose=True)
+
+
+def bench(board, number):
+    module = importlib.import_module("litex_boards.platforms.{}".format(board))
+    io, connectors = module._io, module._connectors
+    r = {}
+    for name, cls in [("default", ConstraintManager), ("indexed", IndexedConstraintManager)]:
+        # Signal/Record creation dominates request() and is identical for both managers, so
+        # requests are done once and only the lookups are timed.
+        cm = cls(io, connectors)
+        for resource in io:
+            cm.request(resource[0], resource[1])
+        r[name] = timeit.timeit(lambda: _lookups(cm, io), number=number)/number
+    return len(io), r
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IO request/lookup micro-benchmark")
+    parser.add_argument("--number", default=1000, type=int, help="iterations per board")
+    parser.add_argument("boards", nargs="*", default=["vc707", "kc705", "kcu105"])
+    args = parser.parse_args()
+
+    for board in args.boards:
+        n, r = bench(board, args.number)
+        print("{:10s} {:4d} IOs: default {:8.1f}us, indexed {:8.1f}us ({:.1f}x)".format(
+            board, n, r["default"]*1e6, r["indexed"]*1e6, r["default"]/r["indexed"]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+"""Static pin-assignment checks for the litex-boards platforms
+
+Expands the _io/_connectors tables of each platform module (and its IO extensions) into a pin
+table without instantiating the Platform or starting any toolchain, and reports:
+- pins assigned twice inside the same IO (error) or shared by numbered instances of the same IO
+  (warning),
+- malformed pin names (empty, or with a stray separator),
+- connector references that do not resolve (unknown connector or connector pin),
+- IOStandard conflicts (several IOStandards on one IO, or different IOStandards on a pin shared
+  by numbered instances of the same IO).
+"""
+
+import sys
+import time
+import pkgutil
+import argparse
+import importlib
+
+from litex.build.generic_platform import Pins, Subsignal, IOStandard
+
+import litex_boards.platforms
+
+# Helpers ------------------------------------------------------------------------------------------
+
+class PinIssue:
+    def __init__(self, platform, variant, kind, message, severity="error"):
+        self.platform = platform
+        self.variant  = variant
+        self.kind     = kind
+        self.message  = message
+        self.severity = severity
+
+    def __str__(self):
+        variant = "" if self.variant is None else "[{}]".format(self.variant)
+        return "{}{}: {} ({}): {}".format(self.platform, variant, self.severity, self.kind, self.message)
+
+
+def _connector_table(connectors):
+    table = {}
+    for connector in connectors:
+        name = connector[0]
+        if isinstance(connector[1], dict):
+            table[name] = dict(connector[1])
+        else:
+            pins = []
+            for p in connector[1:]:
+                pins += p.split()
+            table[name] = {i: None if p == "None" else p for i, p in enumerate(pins)}
+    return table
+
+
+def _is_io_list(value):
+    return (isinstance(value, list) and len(value) and
+        all(isinstance(r, tuple) and len(r) >= 2 and isinstance(r[0], str) for r in value))
+
+
+def _platform_tables(module):
+    """Return [(variant, io, connectors, extensions)] for a platform module"""
+    ios, connectors, extensions = {}, {}, {}
+    for name, value in vars(module).items():
+        if name.startswith("_io") and _is_io_list(value):
+            ios[name[len("_io"):].lstrip("_") or None] = value
+        elif name.startswith("_connectors") and isinstance(value, list):
+            connectors[name[len("_connectors"):].lstrip("_") or None] = value
+        elif name.startswith("_") and _is_io_list(value):
+            extensions[name] = value
+    return [(v, io, connectors.get(v, connectors.get(None, [])), extensions)
+        for v, io in sorted(ios.items(), key=lambda kv: kv[0] or "")]
+
+
+def _expand(resource):
+    """Yield (subsignal, [identifiers], [iostandards]) for an IO resource"""
+    top_pins, top_iostd, subsignals = [], [], []
+    for c in resource[2:]:
+        if isinstance(c, Pins):
+            top_pins += c.identifiers
+        elif isinstance(c, IOStandard):
+            top_iostd.append(c.name)
+        elif isinstance(c, Subsignal):
+            subsignals.append(c)
+    if top_pins:
+        yield None, top_pins, top_iostd
+    for s in subsignals:
+        pins, iostd = [], []
+        for c in s.constraints:
+            if isinstance(c, Pins):
+                pins += c.identifiers
+            elif isinstance(c, IOStandard):
+                iostd.append(c.name)
+        yield s.name, pins, iostd or top_iostd
+
+
+# Check --------------------------------------------------------------------------------------------
+
+def check_tables(platform, variant, io, connectors, extensions={}):
+    issues  = []
+    table   = _connector_table(connectors)
+    def issue(kind, message, severity="error"):
+        issues.append(PinIssue(platform, variant, kind, message, severity))
+
+    groups = [(None, io)] + sorted(extensions.items())
+    for group, resources in groups:
+        pin_users = {} # pin -> [(name, number, subsignal, iostandard)]
+        for resource in resources:
+            name, number = resource[0], resource[1]
+            seen = {}
+            for subsignal, identifiers, iostd in _expand(resource):
+                where = "{}:{}{}".format(name, number, "" if subsignal is None else "." + subsignal)
+                if len(set(iostd)) > 1:
+                    issue("iostandard", "{} has several IOStandards: {}".format(
+                        where, ", ".join(sorted(set(iostd)))))
+                for identifier in identifiers:
+                    pin = identifier
+                    if not identifier or "," in identifier:
+                        issue("malformed", "{} has malformed pin {!r}".format(where, identifier))
+                        continue
+                    if ":" in identifier:
+                        conn, pn = identifier.split(":", 1)
+                        if pn.isdigit():
+                            pn = int(pn)
+                        if conn not in table:
+                            issue("connector", "{} uses unknown connector {}".format(where, identifier))
+                            continue
+                        if pn not in table[conn]:
+                            issue("connector", "{} uses unknown connector pin {}".format(where, identifier))
+                            continue
+                        pin = table[conn][pn]
+                        if pin is None:
+                            issue("connector", "{} uses unconnected connector pin {}".format(where, identifier))
+                            continue
+                    if pin in seen:
+                        issue("duplicate", "{} assigned twice in {} ({} and {})".format(
+                            pin, "{}:{}".format(name, number), seen[pin], where))
+                    seen[pin] = where
+                    pin_users.setdefault(pin, []).append((name, number, where, tuple(sorted(set(iostd)))))
+        for pin, users in sorted(pin_users.items()):
+            # Boards describe alternate uses of the same pins with different IO names (ddram and
+            # ddram_dual_rank, spiflash and spiflash4x, serial and usb_fifo...), so sharing is
+            # only reported between numbered instances of the same IO (user_led:0/user_led:1),
+            # and as a warning since some buses are legitimately shared (MDIO between PHYs).
+            for name in sorted({u[0] for u in users}):
+                same = [u for u in users if u[0] == name]
+                if len({u[1] for u in same}) < 2:
+                    continue
+                issue("shared", "{} assigned to several {} IOs ({})".format(
+                    pin, name, ", ".join(u[2] for u in same)), severity="warning")
+                iostds = {u[3] for u in same if u[3]}
+                if len(iostds) > 1:
+                    issue("iostandard", "{} used with {} by {}".format(pin,
+                        "/".join(sorted("+".join(s) for s in iostds)), ", ".join(u[2] for u in same)))
+    return issues
+
+
+def check_module(module):
+    platform = module.__name__.split(".")[-1]
+    issues   = []
+    for variant, io, connectors, extensions in _platform_tables(module):
+        issues += check_tables(platform, variant, io, connectors, extensions)
+    return issues
+
+
+def platform_modules():
+    for m in pkgutil.iter_modules(litex_boards.platforms.__path__):
+        if m.name.startswith("_"):
+            continue
+        yield importlib.import_module("litex_boards.platforms." + m.name)
+
+
+def check_all(modules=None):
+    issues = []
+    for module in (platform_modules() if modules is None else modules):
+        issues += check_module(module)
+    return issues
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Check pin assignments of the litex-boards platforms")
+    parser.add_argument("platforms", nargs="*", help="platforms to check (default: all)")
+    parser.add_argument("--strict", action="store_true", help="fail on warnings too")
+    args = parser.parse_args()
+
+    start = time.time()
+    if args.platforms:
+        modules = [importlib.import_module("litex_boards.platforms." + p) for p in args.platforms]
+    else:
+        modules = list(platform_modules())
+    issues = check_all(modules)
+    for issue in issues:
+        print(issue)
+    errors = [i for i in issues if args.strict or i.severity == "error"]
+    print("{} platform(s) checked in {:.3f}s, {} error(s), {} warning(s).".format(
+        len(modules), time.time() - start,
+        len([i for i in issues if i.severity == "error"]),
+        len([i for i in issues if i.severity == "warning"])))
+    sys.exit(1 if errors else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+"""Build offload to a pool of worker processes
+
+A BuildServer accepts serialized build requests (target, action, args and optional extra sources)
+over a TCP socket, runs them through the litex-boards CLI in a private directory with at most
+N concurrent builds, streams the build log back and finally returns the generated bitstreams.
+
+    ./remote.py server --port 7890 --workers 4
+    ./remote.py submit kc705,vc707,vcu118 -- --no-compile-software
+    litex-boards kc705 build --remote localhost:7890
+
+Messages are length-prefixed JSON: 4 bytes big-endian length followed by the UTF-8 payload.
+"""
+
+import os
+import sys
+import json
+import base64
+import shutil
+import struct
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import socketserver
+
+# Protocol -----------------------------------------------------------------------------------------
+
+default_port = 7890
+
+artifact_extensions = [".bit", ".bin", ".svf", ".sof", ".rbf", ".fs", ".dfu", ".config"]
+artifact_chunk_size = 1 << 20
+
+
+def send_message(sock, message):
+    data = json.dumps(message).encode("utf-8")
+    sock.sendall(struct.pack(">I", len(data)) + data)
+
+
+def _recv_exact(sock, n):
+    data = b""
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        data += chunk
+    return data
+
+
+def recv_message(sock):
+    length, = struct.unpack(">I", _recv_exact(sock, 4))
+    return json.loads(_recv_exact(sock, length).decode("utf-8"))
+
+
+def build_request(target, action="build", args=[], sources={}):
+    """Serialize a build request, sources being a {relative path: local path} dict"""
+    files = {}
+    for name, path in sources.items():
+        with open(path, "rb") as f:
+            files[name] = base64.b64encode(f.read()).decode("ascii")
+    return {"type": "build", "target": target, "action": action, "args": list(args), "sources": files}
+
+# Server -------------------------------------------------------------------------------------------
+
+class _BuildHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = recv_message(self.request)
+        if request.get("type") != "build":
+            send_message(self.request, {"type": "error", "message": "Unknown request"})
+            return
+        self.server.run_build(request, lambda m: send_message(self.request, m))
+
+
+class BuildServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Build worker pool
+
+    Each connection is a build request; builds are run in subprocesses, with at most workers
+    concurrent builds (others wait their turn while their connection stays open). command is the
+    command prefix used to run a target and is followed by: target, action, "--", args.
+    """
+    daemon_threads      = True
+    allow_reuse_address = True
+
+    def __init__(self, address=("localhost", default_port), workers=1, command=None, workdir=None):
+        socketserver.TCPServer.__init__(self, address, _BuildHandler)
+        self.workers = threading.BoundedSemaphore(workers)
+        self.command = command or [sys.executable, "-m", "litex_boards.tools.litex_boards_cli"]
+        self.workdir = workdir
+
+    def run_build(self, request, send):
+        with self.workers:
+            builddir = tempfile.mkdtemp(prefix="{}_".format(request["target"]), dir=self.workdir)
+            try:
+                # Sources.
+                for name, data in request.get("sources", {}).items():
+                    path = os.path.normpath(os.path.join(builddir, name))
+                    if not path.startswith(builddir + os.sep):
+                        raise ValueError("Invalid source path {}".format(name))
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "wb") as f:
+                        f.write(base64.b64decode(data))
+
+                # Build, streaming the log.
+                cmd = self.command + [request["target"], request.get("action", "build"), "--"]
+                cmd += request.get("args", [])
+                send({"type": "log", "line": "[{}] {}".format(os.getpid(), " ".join(cmd))})
+                p = subprocess.Popen(cmd, cwd=builddir,
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+                for line in p.stdout:
+                    send({"type": "log", "line": line.rstrip("\n")})
+                returncode = p.wait()
+
+                # Artifacts.
+                if returncode == 0:
+                    for root, dirs, files in os.walk(builddir):
+                        for filename in sorted(files):
+                            if os.path.splitext(filename)[1] not in artifact_extensions:
+                                continue
+                            path = os.path.join(root, filename)
+                            name = os.path.relpath(path, builddir)
+                            if name in request.get("sources", {}):
+                                continue
+                            with open(path, "rb") as f:
+                                while True:
+                                    data = f.read(artifact_chunk_size)
+                                    send({"type": "artifact", "name": name,
+                                        "data": base64.b64encode(data).decode("ascii")})
+                                    if len(data) < artifact_chunk_size:
+                                        break
+                send({"type": "done", "returncode": returncode})
+            except (OSError, ValueError) as e:
+                send({"type": "error", "message": str(e)})
+            finally:
+                shutil.rmtree(builddir, ignore_errors=True)
+
+# Client -------------------------------------------------------------------------------------------
+
+def submit(target, action="build", args=[], sources={}, address=("localhost", default_port),
+    output_dir=".", log=print):
+    """Submit a build and wait for it, return (returncode, [artifact paths])"""
+    artifacts = []
+    with socket.create_connection(address) as sock:
+        send_message(sock, build_request(target, action, args, sources))
+        while True:
+            message = recv_message(sock)
+            if message["type"] == "log":
+                log("[{}] {}".format(target, message["line"]))
+            elif message["type"] == "artifact":
+                path = os.path.join(output_dir, message["name"])
+                if path not in artifacts:
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    open(path, "wb").close()
+                    artifacts.append(path)
+                with open(path, "ab") as f:
+                    f.write(base64.b64decode(message["data"]))
+            elif message["type"] == "error":
+                log("[{}] error: {}".format(target, message["message"]))
+                return 1, artifacts
+            elif message["type"] == "done":
+                return message["returncode"], artifacts
+
+
+def submit_matrix(targets, action="build", args=[], sources={}, address=("localhost", default_port),
+    output_dir=".", log=print):
+    """Submit builds of several targets at once, return {target: (returncode, [artifacts])}"""
+    results = {}
+    def _submit(target):
+        results[target] = submit(target, action, args, sources, address,
+            os.path.join(output_dir, target), log)
+    threads = [threading.Thread(target=_submit, args=(t,)) for t in targets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def parse_address(address):
+    host, _, port = address.rpartition(":")
+    return (host or "localhost", int(port or default_port))
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    argv = sys.argv[1:]
+    target_args = []
+    if "--" in argv:
+        i = argv.index("--")
+        argv, target_args = argv[:i], argv[i+1:]
+
+    parser = argparse.ArgumentParser(description="LiteX-Boards build offload")
+    sub = parser.add_subparsers(dest="command")
+    server = sub.add_parser("server", help="run a build server")
+    server.add_argument("--bind",    default="localhost", help="address to listen on")
+    server.add_argument("--port",    default=default_port, type=int, help="port to listen on")
+    server.add_argument("--workers", default=os.cpu_count() or 1, type=int, help="concurrent builds")
+    client = sub.add_parser("submit", help="submit builds (args after -- are passed to targets)")
+    client.add_argument("boards", help="target name(s), comma separated")
+    client.add_argument("action", nargs="?", default="build", help="action (default: build)")
+    client.add_argument("--remote", default="localhost:{}".format(default_port), help="server host:port")
+    client.add_argument("--output-dir", default="remote_builds", help="artifacts directory")
+    client.add_argument("--source", action="append", default=[], help="extra source file to send")
+    args = parser.parse_args(argv)
+
+    if args.command == "server":
+        with BuildServer((args.bind, args.port), workers=args.workers) as s:
+            print("Serving builds on {}:{} with {} worker(s)".format(args.bind, args.port, args.workers))
+            s.serve_forever()
+    elif args.command == "submit":
+        sources = {os.path.basename(s): s for s in args.source}
+        results = submit_matrix(args.boards.split(","), args.action, target_args, sources,
+            parse_address(args.remote), args.output_dir)
+        for target, (returncode, artifacts) in sorted(results.items()):
+            print("{}: {} {}".format(target, "OK" if returncode == 0 else "FAILED", " ".join(artifacts)))
+        sys.exit(int(any(r for r, _ in results.values())))
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
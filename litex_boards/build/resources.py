@@ -0,0 +1,108 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+from litex.build.generic_platform import ConstraintManager, ConstraintError
+
+# Indexed Constraint Manager -----------------------------------------------------------------------
+
+class IndexedConstraintManager(ConstraintManager):
+    """ConstraintManager with a (name, number) index over the IOs
+
+    The default ConstraintManager walks the whole IO list on every request/lookup, which is
+    noticeable on boards with hundreds of IOs/connectors and forces try/except ConstraintError
+    probing in do_finalize. This variant keeps a per-name index of available/matched resources
+    and exposes has_resource() and loose lookups.
+    """
+    def __init__(self, io, connectors):
+        ConstraintManager.__init__(self, io, connectors)
+        self._reindex()
+
+    @classmethod
+    def from_manager(cls, cm):
+        new = cls.__new__(cls)
+        new.__dict__.update(cm.__dict__)
+        new._reindex()
+        return new
+
+    def _reindex(self):
+        self._available_index = {}
+        self._matched_index   = {}
+        for resource in self.available:
+            self._available_index.setdefault(resource[0], []).append(resource)
+        for resource, obj in self.matched:
+            self._matched_index.setdefault(resource[0], []).append((resource, obj))
+
+    def add_extension(self, io, *args, **kwargs):
+        ConstraintManager.add_extension(self, io, *args, **kwargs)
+        self._reindex()
+
+    def _find_available(self, name, number):
+        for resource in self._available_index.get(name, []):
+            if number is None or resource[1] == number:
+                return resource
+        return None
+
+    def has_resource(self, name, number=None):
+        if self._find_available(name, number) is not None:
+            return True
+        for resource, obj in self._matched_index.get(name, []):
+            if number is None or resource[1] == number:
+                return True
+        return False
+
+    def request(self, name, number=None, loose=False):
+        resource = self._find_available(name, number)
+        if resource is None:
+            if loose:
+                return None
+            raise ConstraintError("Resource not found: {}:{}".format(name, number))
+        # Let the base class build the Signal/Record against the already resolved resource only,
+        # avoiding its linear scan of the whole IO list.
+        available = self.available
+        self.available = [resource]
+        try:
+            obj = ConstraintManager.request(self, name, resource[1])
+        finally:
+            self.available = available
+        available.remove(resource)
+        self._available_index[name].remove(resource)
+        self._matched_index.setdefault(name, []).append((resource, obj))
+        return obj
+
+    def lookup_request(self, name, number=None, loose=False):
+        subname = None
+        if ":" in name: name, subname = name.split(":")
+        for resource, obj in self._matched_index.get(name, []):
+            if number is None or resource[1] == number:
+                return obj if subname is None else getattr(obj, subname)
+        if loose:
+            return None
+        raise ConstraintError("Resource not found: {}:{}".format(name, number))
+
+    def resolve_pin(self, identifier):
+        """Resolve a single "CONNECTOR:PIN" identifier (or plain package pin) to a package pin"""
+        if ":" not in identifier:
+            return identifier
+        conn, pn = identifier.split(":")
+        if pn.isdigit():
+            pn = int(pn)
+        try:
+            return self.connector_manager.connector_table[conn][pn]
+        except (KeyError, IndexError):
+            raise ConstraintError("Connector pin not found: {}".format(identifier))
+
+# Indexed Platform ---------------------------------------------------------------------------------
+
+class IndexedPlatform:
+    """Mixin for board platforms with large IO tables
+
+    Call index_resources() right after the vendor Platform.__init__.
+    """
+    def index_resources(self):
+        self.constraint_manager = IndexedConstraintManager.from_manager(self.constraint_manager)
+
+    def has_resource(self, name, number=None):
+        return self.constraint_manager.has_resource(name, number)
+
+    def resolve_pin(self, identifier):
+        return self.constraint_manager.resolve_pin(identifier)
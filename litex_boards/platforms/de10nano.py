@@ -80,7 +80,7 @@ _io = [
     ),
     ("arduino", 0,
         Pins("AG13 AF13 AG10 AG9 U14 U13 AG8 AH8 AF17 AE15 AF15 AG16 AH11 AH12",
-            "AH9, AG11, AH7"),
+            "AH9 AG11 AH7"),
         IOStandard("3.3-V LVTTL")
     ),
 ]
@@ -5,6 +5,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.build.resources import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -531,12 +533,13 @@ _connectors = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(XilinxPlatform):
+class Platform(XilinxPlatform, IndexedPlatform):
     default_clk_name = "clk156"
     default_clk_period = 1e9/156.5e6
 
     def __init__(self):
         XilinxPlatform.__init__(self, "xc7k325t-ffg900-2", _io, _connectors, toolchain="vivado")
+        self.index_resources()
         self.add_platform_command("""
 set_property CFGBVS VCCO [current_design]
 set_property CONFIG_VOLTAGE 2.5 [current_design]
@@ -549,16 +552,11 @@ set_property CONFIG_VOLTAGE 2.5 [current_design]
 
     def do_finalize(self, fragment):
         XilinxPlatform.do_finalize(self, fragment)
-        try:
-            self.add_period_constraint(self.lookup_request("clk200").p, 1e9/200e6)
-        except ConstraintError:
-            pass
-        try:
-            self.add_period_constraint(self.lookup_request("eth_clocks").rx, 1e9/125e6)
-        except ConstraintError:
-            pass
-        try:
-            self.add_period_constraint(self.lookup_request("eth_clocks").tx, 1e9/125e6)
-        except ConstraintError:
-            pass
+        clk200 = self.lookup_request("clk200", loose=True)
+        if clk200 is not None:
+            self.add_period_constraint(clk200.p, 1e9/200e6)
+        eth_clocks = self.lookup_request("eth_clocks", loose=True)
+        if eth_clocks is not None:
+            self.add_period_constraint(eth_clocks.rx, 1e9/125e6)
+            self.add_period_constraint(eth_clocks.tx, 1e9/125e6)
         self.add_platform_command("set_property DCI_CASCADE {{32 34}} [get_iobanks 33]")
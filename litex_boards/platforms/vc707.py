@@ -6,6 +6,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer, XC3SProg
 
+from litex_boards.build.resources import IndexedPlatform
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -633,12 +635,13 @@ _connectors = [
 
 # Platform -----------------------------------------------------------------------------------------
 
-class Platform(XilinxPlatform):
+class Platform(XilinxPlatform, IndexedPlatform):
     default_clk_name   = "clk156"
     default_clk_period = 1e9/156.5e6
 
     def __init__(self):
         XilinxPlatform.__init__(self, "xc7vx485tffg1761-2", _io, _connectors, toolchain="vivado")
+        self.index_resources()
         self.add_platform_command("""set_property CFGBVS VCCO [current_design]""")
         self.add_platform_command("""set_property CONFIG_VOLTAGE 2.5 [current_design]""")
 
@@ -647,11 +650,9 @@ class Platform(XilinxPlatform):
 
     def do_finalize(self, fragment):
         XilinxPlatform.do_finalize(self, fragment)
-        try:
-            self.add_period_constraint(self.lookup_request("clk200").p, 1e9/200e6)
-        except ConstraintError:
-            pass
-        try:
-            self.add_period_constraint(self.lookup_request("sgmii_clock").p, 1e9/125e6)
-        except ConstraintError:
-            pass
+        clk200 = self.lookup_request("clk200", loose=True)
+        if clk200 is not None:
+            self.add_period_constraint(clk200.p, 1e9/200e6)
+        sgmii_clock = self.lookup_request("sgmii_clock", loose=True)
+        if sgmii_clock is not None:
+            self.add_period_constraint(sgmii_clock.p, 1e9/125e6)
@@ -0,0 +1,232 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+import math
+
+from migen import *
+from migen.genlib.resetsync import AsyncResetSynchronizer
+
+# Clocking Feasibility -----------------------------------------------------------------------------
+
+# Search the PLL/MMCM configurations of a LiteX XilinxClocking module (S6PLL, S7PLL, S7MMCM,
+# USMMCM...) or of an IntelPLL for its registered clkin/clkouts when the CRG is created, instead
+# of failing with "No PLL config found" when the SoC is finalized. Outputs that are 1x/2x/4x
+# sys_clk_freq (sys, sys2x, sys4x, sys4x_dqs...) follow sys_clk_freq when looking for achievable
+# alternatives, the other ones (clk200, eth...) are fixed.
+
+sys_clk_ratios = [1, 2, 4]
+
+
+def _divide(vco_freq, freq, margin, d_range):
+    # First divider of d_range (ascending, as XilinxClocking.compute_config) within margin.
+    start, stop, step = (list(d_range) + [1])[:3]
+    d = max(start, start + math.ceil((vco_freq/(freq*(1 + margin)) - start)/step)*step)
+    for d in [d - step, d, d + step]:
+        if d < start or d >= stop:
+            continue
+        if abs(vco_freq/d - freq) <= freq*margin:
+            return d
+    return None
+
+
+def compute_clocking(pll, freqs=None):
+    """Return the configuration XilinxClocking.compute_config would select, None if unfeasible
+
+    freqs optionally overrides the requested clkout frequencies ({n: freq}).
+    """
+    if isinstance(pll, IntelPLL):
+        return pll.compute_config(freqs)
+    clkouts = {n: (f, p, m) for n, (clk, f, p, m) in pll.clkouts.items()}
+    for n, f in (freqs or {}).items():
+        clkouts[n] = (f,) + clkouts[n][1:]
+    (vco_freq_min, vco_freq_max) = pll.vco_freq_range
+    vco_margin = getattr(pll, "vco_margin", 0)
+    for divclk_divide in range(*pll.divclk_divide_range):
+        for clkfbout_mult in reversed(range(*pll.clkfbout_mult_frange)):
+            vco_freq = pll.clkin_freq*clkfbout_mult/divclk_divide
+            if (vco_freq < vco_freq_min*(1 + vco_margin) or
+                vco_freq > vco_freq_max*(1 - vco_margin)):
+                continue
+            config = {"divclk_divide": divclk_divide}
+            for n, (f, p, m) in sorted(clkouts.items()):
+                d_ranges = [pll.clkout_divide_range]
+                if getattr(pll, "clkout{}_divide_range".format(n), None) is not None:
+                    d_ranges += [getattr(pll, "clkout{}_divide_range".format(n))]
+                for d_range in d_ranges:
+                    d = _divide(vco_freq, f, m, d_range)
+                    if d is not None:
+                        config["clkout{}_freq".format(n)]   = vco_freq/d
+                        config["clkout{}_divide".format(n)] = d
+                        config["clkout{}_phase".format(n)]  = p
+                        break
+                else:
+                    break
+            else:
+                config["vco"]           = vco_freq
+                config["clkfbout_mult"] = clkfbout_mult
+                return config
+    return None
+
+
+def _sys_clkouts(pll, sys_clk_freq):
+    r = {}
+    for n, (clk, f, p, m) in pll.clkouts.items():
+        for ratio in sys_clk_ratios:
+            if f == ratio*sys_clk_freq:
+                r[n] = ratio
+    return r
+
+
+def achievable_sys_clk_freqs(pll, sys_clk_freq, span=0.25, step=1e6, n=5):
+    """Return up to n achievable sys_clk_freq (step multiples) nearest to sys_clk_freq
+
+    Only frequencies within sys_clk_freq*(1 +/- span) are tried.
+    """
+    ratios = _sys_clkouts(pll, sys_clk_freq)
+    r = []
+    candidates = range(int(sys_clk_freq*(1 - span)//step), int(sys_clk_freq*(1 + span)//step) + 1)
+    for freq in sorted((c*step for c in candidates if c > 0), key=lambda f: abs(f - sys_clk_freq)):
+        if compute_clocking(pll, {k: ratio*freq for k, ratio in ratios.items()}) is not None:
+            r.append(int(freq))
+            if len(r) == n:
+                break
+    return sorted(r)
+
+
+def check_clocking(pll, sys_clk_freq):
+    """Check the clkouts of pll are feasible, else raise ValueError with achievable sys_clk_freq"""
+    name = type(pll).__name__
+    if pll.clkin_freq is None:
+        raise ValueError("{}: no clkin registered".format(name))
+    clkin_freq_range = getattr(pll, "clkin_freq_range", None)
+    if (clkin_freq_range is not None and
+        not (clkin_freq_range[0] <= pll.clkin_freq <= clkin_freq_range[1])):
+        raise ValueError("{}: clkin {:3.2f}MHz out of range ({:3.2f}-{:3.2f}MHz)".format(
+            name, pll.clkin_freq/1e6, clkin_freq_range[0]/1e6, clkin_freq_range[1]/1e6))
+    config = compute_clocking(pll)
+    if config is None:
+        freqs = achievable_sys_clk_freqs(pll, sys_clk_freq)
+        raise ValueError("{}: sys_clk_freq {:3.2f}MHz not achievable from {:3.2f}MHz clkin ({}), "
+            "achievable: {}".format(name, sys_clk_freq/1e6, pll.clkin_freq/1e6,
+                ", ".join("{:3.2f}MHz".format(f/1e6) for f in pll_clkout_freqs(pll)),
+                ", ".join("{:3.2f}MHz".format(f/1e6) for f in freqs) or "none within 25%"))
+    return config
+
+
+def pll_clkout_freqs(pll):
+    return [f for n, (clk, f, p, m) in sorted(pll.clkouts.items())]
+
+
+def clocking_summary(config):
+    """One line summary of a compute_clocking configuration"""
+    clkouts = sorted(k for k in config if k.startswith("clkout") and k.endswith("_freq"))
+    return "VCO {:3.2f}MHz (x{}/{}): {}".format(config["vco"]/1e6, config["clkfbout_mult"],
+        config["divclk_divide"], ", ".join("{:3.2f}MHz".format(config[k]/1e6) for k in clkouts))
+
+# Intel ALTPLL -------------------------------------------------------------------------------------
+
+class IntelPLL(Module):
+    """ALTPLL of Cyclone IV/10 LP, Cyclone V and MAX10 devices
+
+    Same interface than the LiteX Xilinx PLLs (register_clkin/create_clkout, reset/locked): the
+    CLKn_MULTIPLY_BY/DIVIDE_BY/PHASE_SHIFT parameters are computed from the requested frequencies
+    and phases (in degrees) instead of being written by hand, so phase-shifted clocks (SDRAM clock)
+    follow the requested frequency.
+    """
+    nclkouts_max         = 5
+    n_div_range          = (1, 512+1)
+    m_div_range          = (1, 512+1)
+    c_div_range          = (1, 512+1)
+    clkin_freq_range     = (5e6, 472.5e6)
+    clkin_pfd_freq_range = (5e6, 325e6)
+    vco_freq_ranges      = {
+        "cycloneiv":   (600e6, 1300e6),
+        "cyclone10lp": (600e6, 1300e6),
+        "cyclonev":    (600e6, 1600e6),
+        "max10":       (600e6, 1300e6),
+    }
+
+    def __init__(self, family):
+        if family not in self.vco_freq_ranges:
+            raise ValueError("Unknown PLL family {}, available: {}".format(
+                family, ", ".join(sorted(self.vco_freq_ranges))))
+        self.family         = family
+        self.vco_freq_range = self.vco_freq_ranges[family]
+        self.reset      = Signal()
+        self.locked     = Signal()
+        self.clkin_freq = None
+        self.nclkouts   = 0
+        self.clkouts    = {}
+
+    def register_clkin(self, clkin, freq):
+        self.clkin      = clkin
+        self.clkin_freq = freq
+
+    def create_clkout(self, cd, freq, phase=0, margin=1e-2, with_reset=True):
+        assert self.nclkouts < self.nclkouts_max
+        clkout = Signal()
+        self.clkouts[self.nclkouts] = (clkout, freq, phase, margin)
+        self.nclkouts += 1
+        if with_reset:
+            self.specials += AsyncResetSynchronizer(cd, ~self.locked)
+        self.comb += cd.clk.eq(clkout)
+
+    def compute_config(self, freqs=None):
+        """Return the configuration with the lowest frequency error, None if unfeasible"""
+        clkouts = {n: (f, p, m) for n, (clk, f, p, m) in self.clkouts.items()}
+        for n, f in (freqs or {}).items():
+            clkouts[n] = (f,) + clkouts[n][1:]
+        (vco_freq_min, vco_freq_max) = self.vco_freq_range
+        (pfd_freq_min, pfd_freq_max) = self.clkin_pfd_freq_range
+        best, best_error = None, None
+        n_min = max(self.n_div_range[0], math.ceil(self.clkin_freq/pfd_freq_max))
+        n_max = min(self.n_div_range[1], math.floor(self.clkin_freq/pfd_freq_min) + 1)
+        for n in range(n_min, n_max):
+            m_min = max(self.m_div_range[0], math.ceil(vco_freq_min*n/self.clkin_freq))
+            m_max = min(self.m_div_range[1], math.floor(vco_freq_max*n/self.clkin_freq) + 1)
+            for m in range(m_min, m_max):
+                vco_freq = self.clkin_freq*m/n
+                config   = {"divclk_divide": n, "clkfbout_mult": m, "vco": vco_freq}
+                error    = 0
+                for _n, (f, p, _m) in sorted(clkouts.items()):
+                    c = min(max(round(vco_freq/f), self.c_div_range[0]), self.c_div_range[1] - 1)
+                    if abs(vco_freq/c - f) > f*_m:
+                        break
+                    config["clkout{}_freq".format(_n)]   = vco_freq/c
+                    config["clkout{}_divide".format(_n)] = c
+                    config["clkout{}_phase".format(_n)]  = p
+                    error += abs(vco_freq/c - f)/f
+                else:
+                    if best is None or error < best_error:
+                        best, best_error = config, error
+        return best
+
+    def do_finalize(self):
+        config = self.compute_config()
+        if config is None:
+            raise ValueError("No PLL config found")
+        clkouts = Signal(self.nclkouts_max)
+        params  = dict(
+            p_BANDWIDTH_TYPE         = "AUTO",
+            p_COMPENSATE_CLOCK       = "CLK0",
+            p_INCLK0_INPUT_FREQUENCY = int(1e12/self.clkin_freq),
+            p_OPERATION_MODE         = "NORMAL",
+            i_INCLK                  = self.clkin,
+            o_CLK                    = clkouts,
+            i_ARESET                 = self.reset,
+            i_CLKENA                 = 0x3f,
+            i_EXTCLKENA              = 0xf,
+            i_FBIN                   = 1,
+            i_PFDENA                 = 1,
+            i_PLLENA                 = 1,
+            o_LOCKED                 = self.locked,
+        )
+        for n, (clk, f, p, m) in sorted(self.clkouts.items()):
+            clk_freq = config["clkout{}_freq".format(n)]
+            clk_div  = config["divclk_divide"]*config["clkout{}_divide".format(n)]
+            params["p_CLK{}_DIVIDE_BY".format(n)]   = clk_div
+            params["p_CLK{}_DUTY_CYCLE".format(n)]  = 50
+            params["p_CLK{}_MULTIPLY_BY".format(n)] = config["clkfbout_mult"]
+            params["p_CLK{}_PHASE_SHIFT".format(n)] = str(int(round(1e12/clk_freq*p/360)))
+            self.comb += clk.eq(clkouts[n])
+        self.specials += Instance("ALTPLL", **params)
@@ -0,0 +1,48 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+
+from litedram.frontend.bist import LiteDRAMBISTGenerator, LiteDRAMBISTChecker
+
+# DRAM Bench ---------------------------------------------------------------------------------------
+
+class DRAMBench(Module, AutoCSR):
+    """DRAM bandwidth/latency benchmark
+
+    Adds a LiteDRAM BIST generator (writes) and checker (reads) on their own native crossbar ports,
+    with cycle counters measuring each run from the start pulse to the rising edge of done. Driven
+    from the host by litex_boards/tools/dram_bench.py.
+    """
+    def __init__(self, crossbar):
+        generator_port = crossbar.get_port()
+        checker_port   = crossbar.get_port()
+        self.submodules.generator = LiteDRAMBISTGenerator(generator_port)
+        self.submodules.checker   = LiteDRAMBISTChecker(checker_port)
+
+        self.data_width       = CSRStatus(16, reset=generator_port.data_width)
+        self.generator_cycles = CSRStatus(32)
+        self.checker_cycles   = CSRStatus(32)
+
+        # # #
+
+        self.add_cycles_counter(self.generator, self.generator_cycles)
+        self.add_cycles_counter(self.checker,   self.checker_cycles)
+
+    def add_cycles_counter(self, bist, cycles):
+        running = Signal()
+        done_d  = Signal()
+        self.sync += [
+            done_d.eq(bist.done.status),
+            If(bist.start.re,
+                running.eq(1),
+                cycles.status.eq(0)
+            ).Elif(running,
+                cycles.status.eq(cycles.status + 1),
+                If(bist.done.status & ~done_d,
+                    running.eq(0)
+                )
+            )
+        ]
@@ -0,0 +1,95 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+from migen import *
+from migen.genlib.fifo import SyncFIFO
+
+from litedram.common import LiteDRAMNativePort
+
+# DRAM Channels ------------------------------------------------------------------------------------
+
+# Several independent LiteDRAM controllers (one per DRAM channel) seen as a single memory: each
+# LiteDRAMChannels port is a native port over the address space of all the channels, the channel
+# is selected from the upper address bits (concatenated map, channel 0 first).
+
+
+class LiteDRAMChannelRouter(Module):
+    """Route the commands of a native port to one native port per channel
+
+    Commands are forwarded to the channel selected by their address, write data and read data are
+    then routed in command order (channel of the pending writes/reads kept in FIFOs), so read data
+    coming back from different channels are returned in order.
+    """
+    def __init__(self, port, channel_ports, depth=32):
+        nchannels     = len(channel_ports)
+        address_width = channel_ports[0].address_width
+        assert nchannels >= 2 and nchannels & (nchannels - 1) == 0
+        assert port.address_width == address_width + log2_int(nchannels)
+        for p in channel_ports:
+            assert (p.address_width, p.data_width) == (address_width, port.data_width)
+
+        # # #
+
+        cmd_sel  = Signal(log2_int(nchannels))
+        cmd_addr = Signal(address_width)
+        self.comb += [
+            cmd_sel.eq(port.cmd.addr[address_width:]),
+            cmd_addr.eq(port.cmd.addr[:address_width]),
+        ]
+
+        # Channels of the pending writes/reads, in command order.
+        self.submodules.wsel = wsel = SyncFIFO(len(cmd_sel), depth)
+        self.submodules.rsel = rsel = SyncFIFO(len(cmd_sel), depth)
+        sel_writable = Mux(port.cmd.we, wsel.writable, rsel.writable)
+        cmd_ready    = Signal()
+        self.comb += [
+            port.cmd.ready.eq(cmd_ready & sel_writable),
+            wsel.we.eq(port.cmd.valid & port.cmd.ready & port.cmd.we),
+            wsel.din.eq(cmd_sel),
+            wsel.re.eq(port.wdata.valid & port.wdata.ready),
+            rsel.we.eq(port.cmd.valid & port.cmd.ready & ~port.cmd.we),
+            rsel.din.eq(cmd_sel),
+            rsel.re.eq(port.rdata.valid & port.rdata.ready),
+        ]
+
+        for n, p in enumerate(channel_ports):
+            self.comb += [
+                # Commands.
+                p.cmd.valid.eq(port.cmd.valid & sel_writable & (cmd_sel == n)),
+                p.cmd.last.eq(port.cmd.last),
+                p.cmd.we.eq(port.cmd.we),
+                p.cmd.addr.eq(cmd_addr),
+                If(cmd_sel == n, cmd_ready.eq(p.cmd.ready)),
+
+                # Write data.
+                p.wdata.valid.eq(port.wdata.valid & wsel.readable & (wsel.dout == n)),
+                p.wdata.data.eq(port.wdata.data),
+                p.wdata.we.eq(port.wdata.we),
+                If(wsel.dout == n, port.wdata.ready.eq(p.wdata.ready & wsel.readable)),
+
+                # Read data.
+                p.rdata.ready.eq(port.rdata.ready & rsel.readable & (rsel.dout == n)),
+                If(rsel.dout == n,
+                    port.rdata.valid.eq(p.rdata.valid & rsel.readable),
+                    port.rdata.data.eq(p.rdata.data)
+                ),
+            ]
+
+
+class LiteDRAMChannels(Module):
+    """Crossbar-like access to several LiteDRAM controllers
+
+    get_port() returns a native port over all the channels (same interface than the LiteDRAM
+    crossbar, can be used by DRAMBench, DMAs...), each one using a native port of each channel.
+    """
+    def __init__(self, crossbars):
+        self.crossbars = crossbars
+        self.nchannels = len(crossbars)
+
+    def get_port(self, mode="both"):
+        channel_ports = [crossbar.get_port(mode=mode) for crossbar in self.crossbars]
+        port = LiteDRAMNativePort(mode,
+            address_width = channel_ports[0].address_width + log2_int(self.nchannels),
+            data_width    = channel_ports[0].data_width)
+        self.submodules += LiteDRAMChannelRouter(port, channel_ports)
+        return port
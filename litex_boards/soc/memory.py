@@ -0,0 +1,110 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+from litedram.core.controller import ControllerSettings
+
+# Memory Profiles ----------------------------------------------------------------------------------
+
+# Profiles tune the L2 cache (size, minimum data width) and the LiteDRAM controller (command buffer
+# depth of each bank machine, read/write time slices of the multiplexer). "default" matches the
+# historical l2_size=8192/min_l2_data_width=128 settings of the targets and the LiteDRAM defaults.
+memory_profiles = {
+    "default": dict(
+        l2_size           = 8192,
+        l2_min_data_width = 128,
+        cmd_buffer_depth  = 8,
+        read_time         = 32,
+        write_time        = 16,
+    ),
+    # Bigger L2, shallow command buffers and short read/write slices: less queueing per access.
+    "latency": dict(
+        l2_size           = 16384,
+        l2_min_data_width = 128,
+        cmd_buffer_depth  = 4,
+        read_time         = 16,
+        write_time        = 8,
+    ),
+    # Deep command buffers and long read/write slices: fewer bus turnarounds on streaming accesses.
+    "throughput": dict(
+        l2_size           = 8192,
+        l2_min_data_width = 128,
+        cmd_buffer_depth  = 16,
+        read_time         = 64,
+        write_time        = 32,
+    ),
+    # Minimal resources for small FPGAs.
+    "small": dict(
+        l2_size           = 2048,
+        l2_min_data_width = 32,
+        cmd_buffer_depth  = 4,
+        read_time         = 32,
+        write_time        = 16,
+    ),
+}
+
+# Board family (DRAM PHY) overrides:
+# - sdr:     GENSDRPHY 1:1, 16/32-bit native ports: a 128-bit L2 adds an up-converter, so throughput
+#            uses a native width L2 and latency a smaller one.
+# - s6ddr:   Spartan6 half-rate DDR/LPDDR.
+# - s7ddr:   Artix7/Kintex7 DDR3 1:4, native width >= 128-bit.
+# - usddr:   Kintex/Zynq/Virtex UltraScale(+) DDR4 1:4, up to 512/640-bit native ports: throughput
+#            uses a native width L2.
+# - ecp5ddr: ECP5 DDR3 1:2.
+memory_profile_overrides = {
+    ("sdr",   "latency"):    dict(l2_size=8192, l2_min_data_width=32),
+    ("sdr",   "throughput"): dict(l2_min_data_width=0),
+    ("s6ddr", "throughput"): dict(l2_min_data_width=0),
+    ("usddr", "latency"):    dict(l2_size=32768),
+    ("usddr", "throughput"): dict(l2_min_data_width=0, l2_size=16384),
+}
+
+memory_families = ["sdr", "s6ddr", "s7ddr", "usddr", "ecp5ddr"]
+
+
+class MemoryProfile:
+    def __init__(self, name, family, l2_size, l2_min_data_width, cmd_buffer_depth, read_time, write_time):
+        self.name              = name
+        self.family            = family
+        self.l2_size           = l2_size
+        self.l2_min_data_width = l2_min_data_width
+        self.cmd_buffer_depth  = cmd_buffer_depth
+        self.read_time         = read_time
+        self.write_time        = write_time
+
+    @property
+    def controller_settings(self):
+        return ControllerSettings(
+            cmd_buffer_depth = self.cmd_buffer_depth,
+            read_time        = self.read_time,
+            write_time       = self.write_time)
+
+    def __repr__(self):
+        return ("MemoryProfile({}/{}: L2 {}B >= {}-bit, cmd_buffer_depth {}, read/write time {}/{})"
+            .format(self.name, self.family, self.l2_size, self.l2_min_data_width,
+                self.cmd_buffer_depth, self.read_time, self.write_time))
+
+
+def get_memory_profile(family, kwargs):
+    """Return the MemoryProfile selected by kwargs for a board family
+
+    kwargs are the SoC kwargs: memory_profile selects a profile; without profile, the l2_size and
+    min_l2_data_width kwargs (soc_sdram_args) are used as before.
+    """
+    assert family in memory_families
+    name = kwargs.get("memory_profile", None)
+    if name is None:
+        settings = dict(memory_profiles["default"])
+        settings["l2_size"]           = kwargs.get("l2_size", settings["l2_size"])
+        settings["l2_min_data_width"] = kwargs.get("min_l2_data_width", settings["l2_min_data_width"])
+        return MemoryProfile("default", family, **settings)
+    if name not in memory_profiles:
+        raise ValueError("Unknown memory profile {}, available: {}".format(
+            name, ", ".join(sorted(memory_profiles))))
+    settings = dict(memory_profiles[name])
+    settings.update(memory_profile_overrides.get((family, name), {}))
+    return MemoryProfile(name, family, **settings)
+
+
+def memory_profile_args(parser):
+    parser.add_argument("--memory-profile", default=None, choices=sorted(memory_profiles),
+        help="L2/DRAM controller profile (overrides --l2-size/--min-l2-data-width)")
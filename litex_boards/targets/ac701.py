@@ -18,6 +18,10 @@ from litex.soc.integration.builder import *
 from litedram.modules import MT8JTF12864
 from litedram.phy import s7ddrphy
 
+from litex_boards.soc.clock import check_clocking
+from litex_boards.soc.memory import memory_profile_args, get_memory_profile
+from litex_boards.soc.dram_bench import DRAMBench
+
 from liteeth.phy.a7_gtp import QPLLSettings, QPLL
 from liteeth.phy.a7_1000basex import A7_1000BASEX
 from liteeth.phy.s7rgmii import LiteEthPHYRGMII
@@ -40,13 +44,15 @@ class _CRG(Module):
         pll.create_clkout(self.cd_sys4x,     4*sys_clk_freq)
         pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
         pll.create_clkout(self.cd_clk200,    200e6)
+        check_clocking(pll, sys_clk_freq)
 
         self.submodules.idelayctrl = S7IDELAYCTRL(self.cd_clk200)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_ethernet=False, ethernet_phy="rgmii", **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_ethernet=False, ethernet_phy="rgmii",
+        with_dram_bench=False, **kwargs):
         platform = ac701.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -62,16 +68,23 @@ class BaseSoC(SoCCore):
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
             self.add_csr("ddrphy")
+            memory = get_memory_profile("s7ddr", kwargs)
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
                 module                  = MT8JTF12864(sys_clk_freq, "1:4"),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = kwargs.get("min_l2_data_width", 128),
-                l2_cache_reverse        = True
+                l2_cache_size           = memory.l2_size,
+                l2_cache_min_data_width = memory.l2_min_data_width,
+                l2_cache_reverse        = True,
+                controller_settings     = memory.controller_settings,
             )
 
+            # DRAM Bench
+            if with_dram_bench:
+                self.submodules.dram_bench = DRAMBench(self.sdram.crossbar)
+                self.add_csr("dram_bench")
+
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
             # RGMII Ethernet PHY -------------------------------------------------------------------
@@ -115,15 +128,21 @@ def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on AC701")
     builder_args(parser)
     soc_sdram_args(parser)
+    memory_profile_args(parser)
+    parser.add_argument("--sys-clk-freq", default=100e6,
+                        help="system clock frequency (default=100MHz)")
     parser.add_argument("--with-ethernet", action="store_true",
                         help="enable Ethernet support")
     parser.add_argument("--ethernet-phy", default="rgmii",
                         help="select Ethernet PHY (rgmii or 1000basex)")
+    parser.add_argument("--with-dram-bench", action="store_true", help="enable DRAM benchmark")
     args = parser.parse_args()
 
-    soc = BaseSoC(with_ethernet=args.with_ethernet,
+    soc = BaseSoC(sys_clk_freq=int(float(args.sys_clk_freq)),
+        with_ethernet=args.with_ethernet,
         ethernet_phy=args.ethernet_phy,
-        **soc_sdram_argdict(args))
+        with_dram_bench=args.with_dram_bench,
+        memory_profile=args.memory_profile, **soc_sdram_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build()
 
@@ -18,6 +18,10 @@ from litex.soc.integration.builder import *
 from litedram.modules import MT41K128M16
 from litedram.phy import s7ddrphy
 
+from litex_boards.soc.clock import check_clocking
+from litex_boards.soc.memory import memory_profile_args, get_memory_profile
+from litex_boards.soc.dram_bench import DRAMBench
+
 from liteeth.phy.mii import LiteEthPHYMII
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -42,6 +46,7 @@ class _CRG(Module):
         pll.create_clkout(self.cd_sys4x_dqs, 4*sys_clk_freq, phase=90)
         pll.create_clkout(self.cd_clk200,    200e6)
         pll.create_clkout(self.cd_eth,       25e6)
+        check_clocking(pll, sys_clk_freq)
 
         self.submodules.idelayctrl = S7IDELAYCTRL(self.cd_clk200)
 
@@ -50,7 +55,8 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_ethernet=False, with_etherbone=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_ethernet=False, with_etherbone=False,
+        with_dram_bench=False, **kwargs):
         platform = arty.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -67,16 +73,23 @@ class BaseSoC(SoCCore):
                 sys_clk_freq   = sys_clk_freq,
                 interface_type = "MEMORY")
             self.add_csr("ddrphy")
+            memory = get_memory_profile("s7ddr", kwargs)
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
                 module                  = MT41K128M16(sys_clk_freq, "1:4"),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = kwargs.get("min_l2_data_width", 128),
-                l2_cache_reverse        = True
+                l2_cache_size           = memory.l2_size,
+                l2_cache_min_data_width = memory.l2_min_data_width,
+                l2_cache_reverse        = True,
+                controller_settings     = memory.controller_settings,
             )
 
+            # DRAM Bench
+            if with_dram_bench:
+                self.submodules.dram_bench = DRAMBench(self.sdram.crossbar)
+                self.add_csr("dram_bench")
+
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
             self.submodules.ethphy = LiteEthPHYMII(
@@ -99,14 +112,20 @@ def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on Arty")
     builder_args(parser)
     soc_sdram_args(parser)
+    memory_profile_args(parser)
+    parser.add_argument("--sys-clk-freq", default=100e6,
+                        help="system clock frequency (default=100MHz)")
     vivado_build_args(parser)
     parser.add_argument("--with-ethernet", action="store_true", help="enable Ethernet support")
     parser.add_argument("--with-etherbone", action="store_true", help="enable Etherbone support")
+    parser.add_argument("--with-dram-bench", action="store_true", help="enable DRAM benchmark")
     args = parser.parse_args()
 
     assert not (args.with_ethernet and args.with_etherbone)
-    soc = BaseSoC(with_ethernet=args.with_ethernet, with_etherbone=args.with_etherbone,
-        **soc_sdram_argdict(args))
+    soc = BaseSoC(sys_clk_freq=int(float(args.sys_clk_freq)),
+        with_ethernet=args.with_ethernet, with_etherbone=args.with_etherbone,
+        with_dram_bench=args.with_dram_bench,
+        memory_profile=args.memory_profile, **soc_sdram_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build(**vivado_build_argdict(args))
 
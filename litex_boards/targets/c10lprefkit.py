@@ -16,7 +16,11 @@ from litex.soc.integration.soc_sdram import *
 from litex.soc.integration.builder import *
 
 from litedram.modules import MT48LC16M16
-from litedram.phy import GENSDRPHY
+from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+
+from litex_boards.soc.clock import IntelPLL, check_clocking
+from litex_boards.soc.memory import memory_profile_args, get_memory_profile
+from litex_boards.soc.dram_bench import DRAMBench
 
 from liteeth.phy.mii import LiteEthPHYMII
 
@@ -24,9 +28,13 @@ from litex.soc.cores.hyperbus import HyperRAM
 
 # CRG ----------------------------------------------------------------------------------------------
 class _CRG(Module):
-    def __init__(self, platform):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
         self.clock_domains.cd_sys    = ClockDomain()
-        self.clock_domains.cd_sys_ps = ClockDomain()
+        if sdram_rate == "1:2":
+            self.clock_domains.cd_sys2x    = ClockDomain()
+            self.clock_domains.cd_sys2x_ps = ClockDomain()
+        else:
+            self.clock_domains.cd_sys_ps = ClockDomain()
         self.clock_domains.cd_por    = ClockDomain(reset_less=True)
 
         # # #
@@ -39,41 +47,34 @@ class _CRG(Module):
         self.comb += [
             self.cd_por.clk.eq(clk12),
             self.cd_sys.rst.eq(~rst_n),
-            self.cd_sys_ps.rst.eq(~rst_n)
         ]
+        if sdram_rate == "1:2":
+            self.comb += [
+                self.cd_sys2x.rst.eq(~rst_n),
+                self.cd_sys2x_ps.rst.eq(~rst_n),
+            ]
+        else:
+            self.comb += self.cd_sys_ps.rst.eq(~rst_n)
 
         # sys clk / sdram clk
-        clk_outs = Signal(5)
-        self.specials += \
-            Instance("ALTPLL",
-                p_BANDWIDTH_TYPE         = "AUTO",
-                p_CLK0_DIVIDE_BY         = 6,
-                p_CLK0_DUTY_CYCLE        = 50,
-                p_CLK0_MULTIPLY_BY       = 25,
-                p_CLK0_PHASE_SHIFT       = "0",
-                p_CLK1_DIVIDE_BY         = 6,
-                p_CLK1_DUTY_CYCLE        = 50,
-                p_CLK1_MULTIPLY_BY       = 25,
-                p_CLK1_PHASE_SHIFT       = "-10000",
-                p_COMPENSATE_CLOCK       = "CLK0",
-                p_INCLK0_INPUT_FREQUENCY = 83000,
-                p_INTENDED_DEVICE_FAMILY = "MAX 10",
-                p_LPM_TYPE               = "altpll",
-                p_OPERATION_MODE         = "NORMAL",
-                i_INCLK                  = clk12,
-                o_CLK                    = clk_outs,
-                i_ARESET                 = 0,
-                i_CLKENA                 = 0x3f,
-                i_EXTCLKENA              = 0xf,
-                i_FBIN                   = 1,
-                i_PFDENA                 = 1,
-                i_PLLENA                 = 1,
-            )
-        self.comb += self.cd_sys.clk.eq(clk_outs[0])
-        self.comb += self.cd_sys_ps.clk.eq(clk_outs[1])
-        self.comb += platform.request("sdram_clock").eq(self.cd_sys_ps.clk)
-        platform.add_period_constraint(self.cd_sys.clk, 1e9/50e6)
-        platform.add_period_constraint(self.cd_sys_ps.clk, 1e9/50e6)
+        self.submodules.pll = pll = IntelPLL("cyclone10lp")
+        pll.register_clkin(clk12, 12e6)
+        pll.create_clkout(self.cd_sys,    sys_clk_freq, with_reset=False)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq, with_reset=False)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=-180, with_reset=False)
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=-180, with_reset=False)
+        check_clocking(pll, sys_clk_freq)
+
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.comb += platform.request("sdram_clock").eq(sdram_clk)
+        platform.add_period_constraint(self.cd_sys.clk, 1e9/sys_clk_freq)
+        if sdram_rate == "1:2":
+            platform.add_period_constraint(self.cd_sys2x.clk,    1e9/(2*sys_clk_freq))
+            platform.add_period_constraint(self.cd_sys2x_ps.clk, 1e9/(2*sys_clk_freq))
+        else:
+            platform.add_period_constraint(self.cd_sys_ps.clk, 1e9/sys_clk_freq)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -83,15 +84,15 @@ class BaseSoC(SoCCore):
     }
     mem_map.update(SoCCore.mem_map)
 
-    def __init__(self, sys_clk_freq=int(50e6), with_ethernet=False, **kwargs):
-        assert sys_clk_freq == int(50e6)
+    def __init__(self, sys_clk_freq=int(50e6), with_ethernet=False,
+        sdram_rate="1:1", with_dram_bench=False, **kwargs):
         platform = c10lprefkit.Platform()
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, clk_freq=sys_clk_freq, **kwargs)
 
         # CRG --------------------------------------------------------------------------------------
-        self.submodules.crg = _CRG(platform)
+        self.submodules.crg = _CRG(platform, sys_clk_freq, sdram_rate)
 
         # HyperRam ---------------------------------------------------------------------------------
         self.submodules.hyperram = HyperRAM(platform.request("hyperram"))
@@ -100,17 +101,25 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.submodules.sdrphy = GENSDRPHY(platform.request("sdram"))
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.submodules.sdrphy = sdrphy_cls(platform.request("sdram"))
+            memory = get_memory_profile("sdr", kwargs)
             self.add_sdram("sdram",
                 phy                     = self.sdrphy,
-                module                  = MT48LC16M16(sys_clk_freq, "1:1"),
+                module                  = MT48LC16M16(sys_clk_freq, sdram_rate),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = kwargs.get("min_l2_data_width", 128),
-                l2_cache_reverse        = True
+                l2_cache_size           = memory.l2_size,
+                l2_cache_min_data_width = memory.l2_min_data_width,
+                l2_cache_reverse        = True,
+                controller_settings     = memory.controller_settings,
             )
 
+            # DRAM Bench
+            if with_dram_bench:
+                self.submodules.dram_bench = DRAMBench(self.sdram.crossbar)
+                self.add_csr("dram_bench")
+
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
             self.submodules.ethphy = LiteEthPHYMII(
@@ -125,11 +134,21 @@ def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on C10 LP RefKit")
     builder_args(parser)
     soc_sdram_args(parser)
+    memory_profile_args(parser)
+    parser.add_argument("--sdram-rate", default="1:1", choices=["1:1", "1:2"],
+                        help="SDRAM rate: 1:1 full rate (default) or 1:2 half rate")
+    parser.add_argument("--sys-clk-freq", default=50e6,
+                        help="system clock frequency (default=50MHz)")
     parser.add_argument("--with-ethernet", action="store_true",
                         help="enable Ethernet support")
+    parser.add_argument("--with-dram-bench", action="store_true", help="enable DRAM benchmark")
     args = parser.parse_args()
 
-    soc = BaseSoC(with_ethernet=args.with_ethernet, **soc_sdram_argdict(args))
+    soc = BaseSoC(sys_clk_freq=int(float(args.sys_clk_freq)),
+        with_ethernet=args.with_ethernet,
+        with_dram_bench=args.with_dram_bench,
+        sdram_rate=args.sdram_rate,
+        memory_profile=args.memory_profile, **soc_sdram_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder.build()
 
@@ -21,6 +21,9 @@ from litex.soc.integration.builder import *
 from litedram.modules import MT41K64M16
 from litedram.phy import ECP5DDRPHY
 
+from litex_boards.soc.memory import memory_profile_args, get_memory_profile
+from litex_boards.soc.dram_bench import DRAMBench
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -69,7 +72,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, toolchain="trellis", **kwargs):
+    def __init__(self, toolchain="trellis", with_dram_bench=False, **kwargs):
         platform     = camlink_4k.Platform(toolchain=toolchain)
         sys_clk_freq = int(81e6)
 
@@ -87,16 +90,23 @@ class BaseSoC(SoCCore):
             self.add_csr("ddrphy")
             self.add_constant("ECP5DDRPHY")
             self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
+            memory = get_memory_profile("ecp5ddr", kwargs)
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
                 module                  = MT41K64M16(sys_clk_freq, "1:2"),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = kwargs.get("min_l2_data_width", 128),
-                l2_cache_reverse        = True
+                l2_cache_size           = memory.l2_size,
+                l2_cache_min_data_width = memory.l2_min_data_width,
+                l2_cache_reverse        = True,
+                controller_settings     = memory.controller_settings,
             )
 
+            # DRAM Bench
+            if with_dram_bench:
+                self.submodules.dram_bench = DRAMBench(self.sdram.crossbar)
+                self.add_csr("dram_bench")
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
@@ -105,10 +115,14 @@ def main():
         help="gateware toolchain to use, trellis (default) or diamond")
     builder_args(parser)
     soc_sdram_args(parser)
+    memory_profile_args(parser)
     trellis_args(parser)
+    parser.add_argument("--with-dram-bench", action="store_true", help="enable DRAM benchmark")
     args = parser.parse_args()
 
-    soc = BaseSoC(toolchain=args.toolchain, **soc_sdram_argdict(args))
+    soc = BaseSoC(toolchain=args.toolchain,
+        with_dram_bench=args.with_dram_bench,
+        memory_profile=args.memory_profile, **soc_sdram_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
     builder.build(**builder_kargs)
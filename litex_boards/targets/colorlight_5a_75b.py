@@ -37,7 +37,10 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
 from litedram.modules import M12L16161A
-from litedram.phy import GENSDRPHY
+from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+
+from litex_boards.soc.memory import memory_profile_args, get_memory_profile
+from litex_boards.soc.dram_bench import DRAMBench
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
@@ -60,9 +63,13 @@ class _led(Module):
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
         self.clock_domains.cd_sys    = ClockDomain()
-        self.clock_domains.cd_sys_ps = ClockDomain()
+        if sdram_rate == "1:2":
+            self.clock_domains.cd_sys2x    = ClockDomain()
+            self.clock_domains.cd_sys2x_ps = ClockDomain()
+        else:
+            self.clock_domains.cd_sys_ps = ClockDomain()
         #self.clock_domains.cd_sys_125 = ClockDomain(reset_less=True)
 
 
@@ -78,16 +85,22 @@ class _CRG(Module):
 
         pll.register_clkin(clk25, 25e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=90)
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
         self.specials += AsyncResetSynchronizer(self.cd_sys, ~pll.locked)
 
         # SDRAM clock
-        self.comb += platform.request("sdram_clock").eq(self.cd_sys_ps.clk)
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.comb += platform.request("sdram_clock").eq(sdram_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, revision, toolchain, with_ethernet=False, with_etherbone=False, **kwargs):
+    def __init__(self, revision, toolchain, with_ethernet=False, with_etherbone=False,
+        sdram_rate="1:1", with_dram_bench=False, **kwargs):
         platform     = colorlight_5a_75b.Platform(revision=revision, toolchain=toolchain)
         sys_clk_freq = int(125e6)
 
@@ -98,24 +111,32 @@ class BaseSoC(SoCCore):
         SoCCore.__init__(self, platform, clk_freq=sys_clk_freq, **kwargs)
 
         # CRG --------------------------------------------------------------------------------------
-        self.submodules.crg = _CRG(platform, sys_clk_freq)
+        self.submodules.crg = _CRG(platform, sys_clk_freq, sdram_rate)
 
         # LED --------------------------------------------------------------------------------------
         self.submodules.led = _led(platform, sys_clk_freq)
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.submodules.sdrphy = GENSDRPHY(platform.request("sdram"), cl=2)
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.submodules.sdrphy = sdrphy_cls(platform.request("sdram"), cl=2)
+            memory = get_memory_profile("sdr", kwargs)
             self.add_sdram("sdram",
                 phy                     = self.sdrphy,
-                module                  = M12L16161A(sys_clk_freq, "1:1"),
+                module                  = M12L16161A(sys_clk_freq, sdram_rate),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = kwargs.get("min_l2_data_width", 128),
-                l2_cache_reverse        = True
+                l2_cache_size           = memory.l2_size,
+                l2_cache_min_data_width = memory.l2_min_data_width,
+                l2_cache_reverse        = True,
+                controller_settings     = memory.controller_settings,
             )
 
+            # DRAM Bench
+            if with_dram_bench:
+                self.submodules.dram_bench = DRAMBench(self.sdram.crossbar)
+                self.add_csr("dram_bench")
+
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
@@ -173,6 +194,9 @@ def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on Colorlight 5A-75B")
     builder_args(parser)
     soc_core_args(parser)
+    memory_profile_args(parser)
+    parser.add_argument("--sdram-rate", default="1:1", choices=["1:1", "1:2"],
+                        help="SDRAM rate: 1:1 full rate (default) or 1:2 half rate")
     trellis_args(parser)
     parser.add_argument("--revision", default="7.0", type=str, help="Board revision 7.0 (default) or 6.1")
     parser.add_argument("--gateware-toolchain", dest="toolchain", default="trellis",
@@ -183,6 +207,7 @@ def main():
     parser.add_argument("--load", action="store_true", help="load bitstream")
     parser.add_argument("--flash", action="store_true", help="flash bitstream")
     parser.add_argument("--sim", action="store_true", help="sim led (WIP)")
+    parser.add_argument("--with-dram-bench", action="store_true", help="enable DRAM benchmark")
     args = parser.parse_args()
 
     assert not (args.with_ethernet and args.with_etherbone)
@@ -190,6 +215,9 @@ def main():
         toolchain = args.toolchain,
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
+        with_dram_bench = args.with_dram_bench,
+        sdram_rate      = args.sdram_rate,
+        memory_profile  = args.memory_profile,
         **soc_core_argdict(args))
 
     #builder = Builder(soc, **builder_argdict(args))
@@ -27,6 +27,9 @@ from litex.soc.cores.icap import ICAP
 from litedram.modules import MT8KTF51264
 from litedram.phy import s7ddrphy
 
+from litex_boards.soc.memory import memory_profile_args, get_memory_profile
+from litex_boards.soc.dram_bench import DRAMBench
+
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
 from litepcie.frontend.dma import LitePCIeDMA
@@ -59,7 +62,7 @@ class CRG(Module, AutoCSR):
 # PCIeSoC -----------------------------------------------------------------------------------------
 
 class PCIeSoC(SoCCore):
-    def __init__(self, platform, **kwargs):
+    def __init__(self, platform, with_dram_bench=False, **kwargs):
         sys_clk_freq = int(100e6)
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -94,16 +97,23 @@ class PCIeSoC(SoCCore):
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
             self.add_csr("ddrphy")
+            memory = get_memory_profile("s7ddr", kwargs)
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
                 module                  = MT8KTF51264(sys_clk_freq, "1:4", speedgrade="800"),
                 origin                  = self.mem_map["main_ram"],
                 size                    = kwargs.get("max_sdram_size", 0x40000000),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = kwargs.get("min_l2_data_width", 128),
-                l2_cache_reverse        = True
+                l2_cache_size           = memory.l2_size,
+                l2_cache_min_data_width = memory.l2_min_data_width,
+                l2_cache_reverse        = True,
+                controller_settings     = memory.controller_settings,
             )
 
+            # DRAM Bench
+            if with_dram_bench:
+                self.submodules.dram_bench = DRAMBench(self.sdram.crossbar)
+                self.add_csr("dram_bench")
+
         # PCIe -------------------------------------------------------------------------------------
         # PHY
         self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
@@ -162,6 +172,8 @@ def main():
     parser = argparse.ArgumentParser(description="LiteX SoC on Tagus")
     builder_args(parser)
     soc_sdram_args(parser)
+    memory_profile_args(parser)
+    parser.add_argument("--with-dram-bench", action="store_true", help="enable DRAM benchmark")
     args = parser.parse_args()
 
     # Enforce arguments
@@ -169,7 +181,8 @@ def main():
     args.csr_data_width = 32
 
     platform = nereid.Platform()
-    soc      = PCIeSoC(platform, **soc_sdram_argdict(args))
+    soc      = PCIeSoC(platform, with_dram_bench=args.with_dram_bench,
+        memory_profile=args.memory_profile, **soc_sdram_argdict(args))
     builder  = Builder(soc, **builder_argdict(args))
     vns = builder.build()
     soc.generate_software_headers()
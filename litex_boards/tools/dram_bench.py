@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+"""Host side of the --with-dram-bench SoC option
+
+Connects to a running litex_server (UART/Etherbone/PCIe bridge) and measures sequential/random
+write/read bandwidth and random read latency with the DRAMBench generator/checker.
+
+    litex_server --uart --uart-port=/dev/ttyUSBX   (or --udp / --pcie)
+    ./dram_bench.py --csr-csv=build/csr.csv
+"""
+
+import time
+import argparse
+
+from litex import RemoteClient
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _bist_run(wb, name, base, length, random_addr=False, random_data=False, timeout=10.0):
+    regs = wb.regs
+    getattr(regs, "dram_bench_{}_reset".format(name)).write(1)
+    getattr(regs, "dram_bench_{}_base".format(name)).write(base)
+    getattr(regs, "dram_bench_{}_end".format(name)).write(base + length)
+    getattr(regs, "dram_bench_{}_length".format(name)).write(length)
+    getattr(regs, "dram_bench_{}_random".format(name)).write((random_addr << 1) | random_data)
+    getattr(regs, "dram_bench_{}_start".format(name)).write(1)
+    start = time.time()
+    while not getattr(regs, "dram_bench_{}_done".format(name)).read():
+        if time.time() - start > timeout:
+            raise TimeoutError("DRAM bench {} timeout".format(name))
+    cycles = getattr(regs, "dram_bench_{}_cycles".format(name)).read()
+    errors = regs.dram_bench_checker_errors.read() if name == "checker" else 0
+    return cycles, errors
+
+
+def dram_bench(wb, base, length, latency_runs=16):
+    """Run the benchmark, return a list of (test, bytes, cycles, errors)"""
+    # Random addressing is wrapped to a power of 2 range.
+    assert length & (length - 1) == 0
+    r = []
+    for random in [False, True]:
+        for name, test in [("generator", "write"), ("checker", "read")]:
+            # Checker expects the generator pattern: random data is not used.
+            cycles, errors = _bist_run(wb, name, base, length, random_addr=random)
+            r.append(("{} {}".format("random" if random else "sequential", test), length, cycles, errors))
+    # Latency: single DRAM word random reads.
+    word = wb.regs.dram_bench_data_width.read()//8
+    cycles = 0
+    for i in range(latency_runs):
+        c, _ = _bist_run(wb, "checker", base + ((i*7919*word) % length), word)
+        cycles += c
+    r.append(("read latency", word, cycles/latency_runs, 0))
+    return r
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="DRAM bandwidth/latency benchmark")
+    parser.add_argument("--csr-csv", default="csr.csv",   help="SoC CSR file")
+    parser.add_argument("--host",    default="localhost", help="litex_server host")
+    parser.add_argument("--port",    default=1234, type=int, help="litex_server port")
+    parser.add_argument("--base",    default=None,      help="DRAM test offset (default: half of main_ram)")
+    parser.add_argument("--length",  default="0x100000", help="DRAM test length in bytes (power of 2)")
+    args = parser.parse_args()
+
+    wb = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    wb.open()
+    try:
+        sys_clk_freq = wb.constants.config_clock_frequency
+        length       = int(args.length, 0)
+        base         = wb.mems.main_ram.size//2 if args.base is None else int(args.base, 0)
+        print("DRAM bench: {:d}MHz sys_clk, {:d}-bit port, {:d}KiB @ 0x{:08x}".format(
+            int(sys_clk_freq/1e6), wb.regs.dram_bench_data_width.read(), length//1024, base))
+        for test, nbytes, cycles, errors in dram_bench(wb, base, length):
+            t = cycles/sys_clk_freq
+            if test == "read latency":
+                print("{:20s}: {:8.1f} cycles ({:.1f}ns)".format(test, cycles, t*1e9))
+            else:
+                print("{:20s}: {:8.1f} MB/s ({:d} cycles, {:d} errors)".format(
+                    test, nbytes/t/1e6, cycles, errors))
+    finally:
+        wb.close()
+
+if __name__ == "__main__":
+    main()
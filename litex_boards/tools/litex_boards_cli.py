@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+"""litex-boards: run any litex-boards target from a single entry point
+
+    litex-boards list
+    litex-boards arty build -- --with-ethernet --no-compile-gateware
+    litex-boards arty,kc705,vc707 build -- --no-compile-software
+    litex-boards colorlight_5a_75b load
+    litex-boards kc705 report
+    litex-boards kc705,vc707 build --remote buildhost:7890
+
+Targets are discovered from litex_boards.targets (or added with register_target) without being
+imported, then imported and dispatched in-process: litex/migen are only imported once when
+driving several boards, and the arguments given after "--" are shared by all of them.
+"""
+
+import os
+import re
+import sys
+import pkgutil
+import argparse
+import importlib
+import importlib.util
+
+import litex_boards.targets
+
+# Registry -----------------------------------------------------------------------------------------
+
+actions = ["build", "load", "flash", "sim", "report"]
+
+class Target:
+    def __init__(self, name, module, filename=None):
+        self.name     = name
+        self.module   = module
+        self.filename = filename
+        self.description = ""
+        self.actions     = ["build", "report"]
+        self.platforms   = []
+        if filename is not None:
+            self._scan(filename)
+
+    def _scan(self, filename):
+        # Extract description/platforms/supported actions from the source: some files of the
+        # targets directory run code at import (bit_to_flash.py), and importing all targets would
+        # import every litex core.
+        with open(filename) as f:
+            source = f.read()
+        m = re.search(r"ArgumentParser\(description=\"([^\"]*)\"", source)
+        if m is not None:
+            self.description = m.group(1)
+        for m in re.finditer(r"from litex_boards.platforms import ([\w, ]+)", source):
+            self.platforms += ["litex_boards.platforms." + p.strip() for p in m.group(1).split(",")]
+        for action in ["load", "flash", "sim"]:
+            if "\"--{}\"".format(action) in source:
+                self.actions.append(action)
+
+    def import_module(self):
+        return importlib.import_module(self.module)
+
+
+_targets = {}
+
+def register_target(name, module, filename=None):
+    """Register an (out of tree) target module providing a main() function"""
+    _targets[name] = Target(name, module, filename)
+
+
+def discover_targets():
+    for m in pkgutil.iter_modules(litex_boards.targets.__path__):
+        if m.name.startswith("_") or m.name in _targets:
+            continue
+        module   = "litex_boards.targets." + m.name
+        filename = importlib.util.find_spec(module).origin
+        with open(filename) as f:
+            if "\ndef main(" not in f.read():
+                continue
+        register_target(m.name, module, filename)
+    return _targets
+
+
+def get_target(name):
+    targets = discover_targets()
+    if name not in targets:
+        raise ValueError("Unknown target {}, available: {}".format(name, ", ".join(sorted(targets))))
+    return targets[name]
+
+# Dispatch -----------------------------------------------------------------------------------------
+
+def run(name, action="build", args=[]):
+    """Run action on target name in-process, return 0 on success"""
+    target = get_target(name)
+    if action not in target.actions:
+        raise ValueError("{} does not support {} (supported: {})".format(
+            name, action, ", ".join(target.actions)))
+
+    if action == "report":
+        from litex_boards.build.pins import check_module
+        print("{}: {} ({})".format(target.name, target.description, target.module))
+        print("  actions:   {}".format(", ".join(target.actions)))
+        errors = 0
+        for platform in target.platforms:
+            issues  = check_module(importlib.import_module(platform))
+            errors += len([i for i in issues if i.severity == "error"])
+            print("  platform:  {} ({} pin issue(s))".format(platform, len(issues)))
+            for issue in issues:
+                print("    {}".format(issue))
+        return int(errors != 0)
+
+    argv = list(args)
+    if action != "build":
+        argv.append("--" + action)
+    module   = target.import_module()
+    sys_argv = sys.argv
+    sys.argv = [os.path.basename(target.filename or name)] + argv
+    try:
+        module.main()
+    except SystemExit as e:
+        # argparse errors and targets calling exit() after load/flash.
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+    finally:
+        sys.argv = sys_argv
+    return 0
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    target_args = []
+    if "--" in argv:
+        i = argv.index("--")
+        argv, target_args = argv[:i], argv[i+1:]
+
+    parser = argparse.ArgumentParser(description="LiteX-Boards targets",
+        epilog="Arguments after -- are passed to every target (ex: -- --no-compile-gateware).")
+    parser.add_argument("boards", help="target name(s), comma separated, or \"list\"")
+    parser.add_argument("action", nargs="?", default="build", choices=actions, help="action (default: build)")
+    parser.add_argument("--keep-going", action="store_true", help="continue with the next boards on failure")
+    parser.add_argument("--remote", default=None, help="offload to a build server (host:port)")
+    args = parser.parse_args(argv)
+
+    if args.boards == "list":
+        for name, target in sorted(discover_targets().items()):
+            print("{:24s} {:40s} [{}]".format(name, target.description, ", ".join(target.actions)))
+        return 0
+
+    if args.remote is not None:
+        from litex_boards.build.remote import submit_matrix, parse_address
+        results  = submit_matrix(args.boards.split(","), args.action, target_args,
+            address=parse_address(args.remote), output_dir="remote_builds")
+        failures = [board for board, (r, _) in sorted(results.items()) if r]
+        if failures:
+            print("Failed: {}".format(", ".join(failures)), file=sys.stderr)
+        return int(len(failures) != 0)
+
+    failures = []
+    for board in args.boards.split(","):
+        try:
+            r = run(board, args.action, target_args)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            r = 1
+        if r:
+            failures.append(board)
+            if not args.keep_going:
+                break
+    if failures:
+        print("Failed: {}".format(", ".join(failures)), file=sys.stderr)
+    return int(len(failures) != 0)
+
+if __name__ == "__main__":
+    sys.exit(main())
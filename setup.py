@@ -32,4 +32,9 @@ setup(
     ],
     include_package_data=True,
     packages=find_packages(),
+    entry_points={
+        "console_scripts": [
+            "litex-boards=litex_boards.tools.litex_boards_cli:main",
+        ],
+    },
 )
@@ -0,0 +1,21 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+import unittest
+
+from litex_boards.tools.litex_boards_cli import discover_targets, run
+
+
+class TestCLI(unittest.TestCase):
+    def test_discover(self):
+        targets = discover_targets()
+        self.assertIn("arty", targets)
+        self.assertNotIn("bit_to_flash", targets)
+        self.assertEqual(targets["arty"].platforms, ["litex_boards.platforms.arty"])
+        self.assertIn("load", targets["colorlight_5a_75b"].actions)
+
+    def test_unsupported_action(self):
+        with self.assertRaises(ValueError):
+            run("arty", "sim")
+        with self.assertRaises(ValueError):
+            run("unknown_board")
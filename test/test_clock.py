@@ -0,0 +1,68 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+import unittest
+
+from migen import *
+
+from litex.soc.cores.clock import S6PLL, S7PLL, S7MMCM
+
+from litex_boards.soc.clock import IntelPLL
+from litex_boards.soc.clock import compute_clocking, check_clocking, achievable_sys_clk_freqs
+
+
+def pll_with_clkouts(cls, clkin_freq, freqs, speedgrade=-1):
+    pll = cls(speedgrade=speedgrade)
+    pll.register_clkin(Signal(), clkin_freq)
+    for freq in freqs:
+        pll.create_clkout(ClockDomain("cd"), freq)
+    return pll
+
+
+class TestClock(unittest.TestCase):
+    def test_compute_config(self):
+        # Same configuration than XilinxClocking.compute_config.
+        for cls in [S6PLL, S7PLL, S7MMCM]:
+            for sys_clk_freq in [50e6, 75e6, 100e6, 125e6, 150e6, 175e6]:
+                pll = pll_with_clkouts(cls, 100e6, [sys_clk_freq, 4*sys_clk_freq, 200e6, 25e6])
+                try:
+                    reference = pll.compute_config()
+                except ValueError:
+                    reference = None
+                config = compute_clocking(pll)
+                self.assertEqual(config is None, reference is None)
+                if config is not None:
+                    for k, v in config.items():
+                        self.assertAlmostEqual(v, reference[k])
+
+    def test_check(self):
+        sys_clk_freq = 171e6
+        pll = pll_with_clkouts(S7PLL, 100e6, [sys_clk_freq, 2*sys_clk_freq, 4*sys_clk_freq, 200e6, 25e6])
+        with self.assertRaises(ValueError):
+            check_clocking(pll, sys_clk_freq)
+        freqs = achievable_sys_clk_freqs(pll, sys_clk_freq)
+        self.assertEqual(len(freqs), 5)
+        for freq in freqs:
+            pll = pll_with_clkouts(S7PLL, 100e6, [freq, 2*freq, 4*freq, 200e6, 25e6])
+            self.assertEqual(check_clocking(pll, freq)["clkout3_freq"], 200e6)
+
+    def test_intel_pll(self):
+        def altpll_params(sys_clk_freq):
+            pll = IntelPLL("cycloneiv")
+            pll.register_clkin(Signal(), 50e6)
+            pll.create_clkout(ClockDomain("sys"), sys_clk_freq)
+            pll.create_clkout(ClockDomain("sys_ps"), sys_clk_freq, phase=90, with_reset=False)
+            check_clocking(pll, sys_clk_freq)
+            altpll = [s for s in pll.get_fragment().specials if isinstance(s, Instance)][0]
+            return {i.name: getattr(i.value, "value", i.value) for i in altpll.items
+                if isinstance(i, Instance.Parameter)}
+
+        # de0nano: 50MHz sys and 90° SDRAM clock from clk50, as the previous hand-written ALTPLL.
+        params = altpll_params(50e6)
+        self.assertEqual(params["CLK0_MULTIPLY_BY"], params["CLK0_DIVIDE_BY"])
+        self.assertEqual(params["CLK1_PHASE_SHIFT"], "5000")
+
+        # SDRAM clock phase follows sys_clk_freq.
+        params = altpll_params(100e6)
+        self.assertEqual(2*params["CLK0_DIVIDE_BY"], params["CLK0_MULTIPLY_BY"])
+        self.assertEqual(params["CLK1_PHASE_SHIFT"], "2500")
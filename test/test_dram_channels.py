@@ -0,0 +1,88 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+import random
+import unittest
+
+from migen import *
+
+from litedram.common import LiteDRAMNativePort
+
+from litex_boards.soc.dram_channels import LiteDRAMChannelRouter
+
+
+@passive
+def channel_model(port, mem, latency):
+    # Native port of a DRAM controller: accepts commands, then write data/returns read data.
+    pending = []
+    while True:
+        yield port.cmd.ready.eq(random.random() > 0.3)
+        yield port.wdata.ready.eq(0)
+        yield port.rdata.valid.eq(0)
+        if pending and pending[0][2] <= 0:
+            we, addr, _ = pending[0]
+            if we:
+                yield port.wdata.ready.eq(1)
+                if (yield port.wdata.valid):
+                    mem[addr] = (yield port.wdata.data)
+                    pending.pop(0)
+            else:
+                yield port.rdata.valid.eq(1)
+                yield port.rdata.data.eq(mem.get(addr, 0))
+                if (yield port.rdata.ready):
+                    pending.pop(0)
+        for p in pending:
+            p[2] -= 1
+        if (yield port.cmd.valid) & (yield port.cmd.ready):
+            pending.append([(yield port.cmd.we), (yield port.cmd.addr), latency])
+        yield
+
+
+class TestDRAMChannels(unittest.TestCase):
+    def test_router(self):
+        port     = LiteDRAMNativePort("both", address_width=9, data_width=32)
+        channels = [LiteDRAMNativePort("both", address_width=8, data_width=32) for _ in range(2)]
+        dut      = LiteDRAMChannelRouter(port, channels, depth=4)
+        mems     = [{}, {}]
+        addrs    = [random.randrange(2**9) for _ in range(64)]
+        data     = {a: random.randrange(2**32) for a in addrs}
+        reads    = []
+
+        def commands():
+            for we in [1, 0]:
+                for addr in addrs:
+                    yield port.cmd.valid.eq(1)
+                    yield port.cmd.we.eq(we)
+                    yield port.cmd.addr.eq(addr)
+                    yield
+                    while not (yield port.cmd.ready):
+                        yield
+                yield port.cmd.valid.eq(0)
+                for i in range(64):
+                    yield
+
+        def writes():
+            for addr in addrs:
+                yield port.wdata.valid.eq(1)
+                yield port.wdata.we.eq(0xf)
+                yield port.wdata.data.eq(data[addr])
+                yield
+                while not (yield port.wdata.ready):
+                    yield
+            yield port.wdata.valid.eq(0)
+
+        def read_data():
+            yield port.rdata.ready.eq(1)
+            while len(reads) < len(addrs):
+                if (yield port.rdata.valid):
+                    reads.append((yield port.rdata.data))
+                yield
+
+        generators = [commands(), writes(), read_data()]
+        generators += [channel_model(channels[n], mems[n], latency=4 + 5*n) for n in range(2)]
+        run_simulation(dut, generators)
+
+        # Concatenated map: upper address bit selects the channel.
+        for addr in addrs:
+            self.assertEqual(mems[addr >> 8][addr & 0xff], data[addr])
+        self.assertEqual(reads, [data[addr] for addr in addrs])
@@ -0,0 +1,24 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+import unittest
+
+from litex_boards.soc.memory import get_memory_profile
+
+
+class TestMemoryProfiles(unittest.TestCase):
+    def test_default(self):
+        # Without profile, the soc_sdram_args L2 settings are used.
+        profile = get_memory_profile("s7ddr", {"l2_size": 4096, "min_l2_data_width": 64})
+        self.assertEqual((profile.name, profile.l2_size, profile.l2_min_data_width), ("default", 4096, 64))
+        self.assertEqual(profile.controller_settings.cmd_buffer_depth, 8)
+
+    def test_family_override(self):
+        profile = get_memory_profile("usddr", {"memory_profile": "throughput", "l2_size": 4096})
+        self.assertEqual((profile.l2_size, profile.l2_min_data_width), (16384, 0))
+        settings = profile.controller_settings
+        self.assertEqual((settings.cmd_buffer_depth, settings.read_time, settings.write_time), (16, 64, 32))
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            get_memory_profile("sdr", {"memory_profile": "fast"})
@@ -0,0 +1,60 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+import time
+import unittest
+
+from litex.build.generic_platform import *
+
+from litex_boards.build.pins import check_tables, check_all
+
+
+class TestPins(unittest.TestCase):
+    def check(self, io, connectors=[]):
+        return [(i.severity, i.kind) for i in check_tables("test", None, io, connectors)]
+
+    def test_clean(self):
+        io = [
+            ("user_led", 0, Pins("A1"), IOStandard("LVCMOS33")),
+            ("user_led", 1, Pins("j1:0"), IOStandard("LVCMOS33")),
+            ("serial", 0,
+                Subsignal("tx", Pins("B1")),
+                Subsignal("rx", Pins("B2")),
+                IOStandard("LVCMOS33")
+            ),
+            ("usb_fifo", 0, Pins("B1 B2"), IOStandard("LVCMOS33")),
+        ]
+        self.assertEqual(self.check(io, [("j1", "C1 None")]), [])
+
+    def test_duplicate(self):
+        io = [("sdram", 0, Subsignal("a", Pins("A1 A2")), Subsignal("ba", Pins("A1")))]
+        self.assertEqual(self.check(io), [("error", "duplicate")])
+
+    def test_shared(self):
+        io = [("user_led", 0, Pins("A1")), ("user_led", 1, Pins("A1"))]
+        self.assertEqual(self.check(io), [("warning", "shared")])
+
+    def test_connector(self):
+        io = [
+            ("gpio", 0, Pins("j1:0 j1:1 j1:2 j2:0")),
+        ]
+        self.assertEqual(self.check(io, [("j1", "C1 None")]),
+            [("error", "connector")]*3)
+
+    def test_iostandard(self):
+        io = [
+            ("clk", 0, Pins("A1"), IOStandard("LVCMOS33"), IOStandard("LVCMOS18")),
+            ("user_led", 0, Pins("A2"), IOStandard("LVCMOS33")),
+            ("user_led", 1, Pins("A2"), IOStandard("LVCMOS18")),
+        ]
+        self.assertEqual(self.check(io),
+            [("error", "iostandard"), ("warning", "shared"), ("error", "iostandard")])
+
+    def test_malformed(self):
+        io = [("gpio", 0, Pins("A1, A2"))]
+        self.assertEqual(self.check(io), [("error", "malformed")])
+
+    def test_all_platforms(self):
+        start  = time.time()
+        check_all()
+        self.assertLess(time.time() - start, 1.0)
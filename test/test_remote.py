@@ -0,0 +1,60 @@
+# This file is Copyright (c) 2020 LiteX-Hub community
+# License: BSD
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+from litex_boards.build.remote import BuildServer, submit, submit_matrix
+
+# Stand-in for the litex-boards CLI: logs its arguments, checks the extra source and writes a
+# bitstream derived from the target name.
+fake_build = """
+import os, sys
+target, action, _, *args = sys.argv[1:]
+print("building", target, action, " ".join(args))
+if target == "broken":
+    sys.exit(1)
+if os.path.exists("user.v"):
+    print("source:", open("user.v").read())
+os.makedirs(os.path.join("soc_" + target, "gateware"))
+with open(os.path.join("soc_" + target, "gateware", "top.bit"), "wb") as f:
+    f.write(target.encode() * 1000)
+"""
+
+
+class TestRemote(unittest.TestCase):
+    def setUp(self):
+        self.server = BuildServer(("localhost", 0), workers=2,
+            command=[sys.executable, "-c", fake_build])
+        self.address = self.server.server_address
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_submit(self):
+        with tempfile.TemporaryDirectory() as d:
+            source = os.path.join(d, "user.v")
+            with open(source, "w") as f:
+                f.write("module user();endmodule")
+            logs = []
+            r, artifacts = submit("kc705", args=["--no-compile-software"], sources={"user.v": source},
+                address=self.address, output_dir=d, log=logs.append)
+            self.assertEqual(r, 0)
+            self.assertEqual(artifacts, [os.path.join(d, "soc_kc705", "gateware", "top.bit")])
+            with open(artifacts[0], "rb") as f:
+                self.assertEqual(f.read(), b"kc705"*1000)
+            self.assertIn("[kc705] building kc705 build --no-compile-software", logs)
+            self.assertIn("[kc705] source: module user();endmodule", logs)
+
+    def test_matrix(self):
+        with tempfile.TemporaryDirectory() as d:
+            results = submit_matrix(["kc705", "vc707", "broken"], address=self.address,
+                output_dir=d, log=lambda l: None)
+            self.assertEqual(results["kc705"][0], 0)
+            self.assertEqual(results["vc707"][0], 0)
+            self.assertEqual(results["broken"], (1, []))